@@ -1,11 +1,56 @@
+import csv
 import json
+import orjson
 from web3 import Web3
 import pandas as pd
+import httpx
 import requests
+import simdjson
+from requests.adapters import HTTPAdapter
 import warnings
-from collections import ChainMap
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tenacity import retry, retry_if_exception, retry_if_exception_type, stop_after_attempt, wait_exponential
 from web3 import exceptions
-from json import JSONDecodeError
+
+_REQUEST_TIMEOUT = 10
+
+
+class _EtherscanRateLimitError(Exception):
+    """
+    Raised when Etherscan rejects a call because the rate limit of the API key has been reached.
+    """
+
+
+class _ProviderBatchError(Exception):
+    """
+    Raised when the Web3 provider answers a JSON-RPC batch request, or one of its calls, with an error.
+    """
+
+
+def _isTransientRequestError(error):
+    """
+    Checking whether the failed Etherscan or Web3 provider request is worth repeating: the server has throttled the
+    request, failed with a server error, timed out or has not been reached.
+    """
+
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and (error.response.status_code == 429
+                                               or error.response.status_code >= 500)
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def _isTransientMetadataError(error):
+    """
+    Checking whether the failed metadata request is worth repeating: the host has throttled the request, failed with
+    a server error, timed out or dropped the connection. Errors which repeat on every attempt, such as an unsupported
+    URL scheme, are not repeated.
+    """
+
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError))
 
 
 class Token:
@@ -24,6 +69,8 @@ class Token:
         Token's contract address. The address of a token contract can be obtained from https://etherscan.io
     etherscanAPIKey : str
          Your Etherscan API key. The API key can be obtained from https://etherscan.io/apis.
+    cacheFolderPath : str
+        Path to the folder where the fetched metadata of the tokens is cached. If None, the metadata is not cached.
 
     Attributes
     ----------
@@ -37,32 +84,82 @@ class Token:
         Contract's address.
     contract : web3.eth.Contract
         Token's contract, used to invoke contract's functions.
+    symbol : str
+        Token's symbol, used in the names of the created files.
     etherscanAPIKey : str
         User's etherscan API key.
+    session : requests.Session
+        HTTP session reused by the Etherscan and Web3 provider requests.
+    cacheFolder : pathlib.Path
+        Folder of the cached metadata of the token's collection. None if the caching is disabled.
     attributes : list
         List of dictionaries with traits name being the key and value being the value.
     transactions : list
         List of sales (transactions which value is higher than zero) details dictionaries.
     """
 
-    def __init__(self, providerURL, tokenContractAddress, etherscanAPIKey):
+    def __init__(self, providerURL, tokenContractAddress, etherscanAPIKey, cacheFolderPath='~/.cache/token/'):
         self.web3 = Web3(Web3.HTTPProvider(providerURL))
         if not (self.web3.isConnected()):
             raise ValueError('Can not connect to Web3. Please, check the connection and Provider URL correctness.')
         self.providerURL = providerURL
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         abiURL = ('https://api.etherscan.io/api?module=contract&action=getabi&address='
                   + tokenContractAddress
                   + '&apikey='
                   + etherscanAPIKey)
-        abiRequest = requests.get(abiURL).json()
+        abiRequest = self._etherscanRequest(abiURL)
         if abiRequest['status'] != '1':
             raise ValueError("Token's contract address or/and Etherscan API Key are invalid.")
         self.abi = abiRequest['result']
         self.tokenContractAddress = tokenContractAddress
         self.contract = self.web3.eth.contract(address=self.tokenContractAddress, abi=self.abi)
+        self.symbol = self.contract.functions.symbol().call()
         self.etherscanAPIKey = etherscanAPIKey
+        self.cacheFolder = (None if cacheFolderPath is None
+                            else Path(cacheFolderPath).expanduser() / tokenContractAddress.lower())
         self.attributes = []
         self.transactions = []
+        self._metadataClient = httpx.Client(
+            transport=httpx.HTTPTransport(http2=True,
+                                          limits=httpx.Limits(max_connections=100, max_keepalive_connections=100)),
+            timeout=_REQUEST_TIMEOUT,
+            follow_redirects=True)
+        self._metadataParser = simdjson.Parser()
+        self._baseURL = None
+        self._maxTokens = None
+
+    @retry(wait=wait_exponential(multiplier=0.2, max=10),
+           stop=stop_after_attempt(6),
+           retry=(retry_if_exception_type((_EtherscanRateLimitError, orjson.JSONDecodeError))
+                  | retry_if_exception(_isTransientRequestError)),
+           reraise=True)
+    def _etherscanRequest(self, url):
+        """
+        Calling etherscan API. The call is repeated with exponential backoff when the rate limit has been reached, the
+        request has timed out, has not reached etherscan or has been answered with a 429 or 5xx status, or the
+        response is not a json document.
+
+        Attributes
+        ----------
+        url : str
+            URL of the etherscan API call.
+
+        Returns
+        ----------
+        r : dict
+            Decoded response of etherscan API.
+        """
+
+        response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        r = orjson.loads(response.content)
+        if r['status'] != '1' and 'rate limit' in str(r['result']):
+            raise _EtherscanRateLimitError(r['result'])
+        return r
 
     def cleanAttributes(self):
         """
@@ -78,7 +175,7 @@ class Token:
 
         self.transactions = []
 
-    def parseAttributes(self, start=0, end=-9999):
+    def parseAttributes(self, start=0, end=-9999, maxWorkers=64):
         """
         Parsing attributes of a token's collection from id start to id finish. If the attributes are not provided,
         the parsing starts from the first NFT token in the collection and ends on the last.
@@ -86,73 +183,262 @@ class Token:
         It is vital to notion that name of each token is parsed and added to attribute, as the order of parsed tokens can
         be wrong.
 
+        The metadata of the tokens is fetched concurrently over HTTP/2 when the host supports it, while the attributes
+        are appended in the order of token ids. The metadata containing attributes is cached in the cache folder and
+        is not fetched again by later parses.
+
         Attributes
         ----------
         start : int
             Starting token id. Parsing of the attributes starts from this token.
         end : int
             Ending token id. Parsing of the attributes ends on this token.
+        maxWorkers : int
+            Number of metadata requests sent concurrently. At most twice as many requests are queued at once.
         """
 
-        baseURL = self.contract.functions.tokenURI(1).call()[:-1]
+        if self._baseURL is None:
+            self._baseURL = self.contract.functions.tokenURI(1).call()[:-1]
+        baseURL = self._baseURL
+        if not baseURL.startswith(('http://', 'https://')):
+            raise ValueError("The metadata URL " + baseURL + " is not an HTTP(S) URL. "
+                             "Metadata stored on IPFS or on-chain is not supported.")
         if end == -9999:
             try:
-                end = self.contract.functions.maxTokens().call()
+                if self._maxTokens is None:
+                    self._maxTokens = self.contract.functions.maxTokens().call()
+                end = self._maxTokens
             except exceptions.ABIFunctionNotFound:
+                # The total supply grows while the collection is minted, so it is not cached.
                 end = self.contract.functions.totalSupply().call()
-        if start == 0:
+        tokenIds = range(start, end + 1)
+        if self.cacheFolder is not None:
             try:
-                r = requests.get(baseURL + str(start)).json()
-                r['attributes'].append({'trait_type': 'Name', 'value': r['name']})
-                self.attributes.append([dict(ChainMap(*[{d['trait_type']: d['value']} for d in r['attributes']]))])
-            except JSONDecodeError:
-                warnings.warn("The NFT collection starts from id #1, not id #0.")
+                self.cacheFolder.mkdir(parents=True, exist_ok=True)
+            except OSError as error:
+                self._disableCache(error)
+
+        warningCounts = Counter()
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            try:
+                for tokenId in tokenIds:
+                    pending.append((tokenId, executor.submit(self._fetchMetadata, baseURL, tokenId)))
+                    # Only a bounded window of requests is in flight, so fetched responses do not pile up behind a slow
+                    # token and an error does not have to wait for the whole collection to be requested.
+                    if len(pending) == 2 * maxWorkers:
+                        self._addAttributes(*pending.popleft(), warningCounts)
+                while pending:
+                    self._addAttributes(*pending.popleft(), warningCounts)
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+        for message, count in warningCounts.items():
+            warnings.warn(message + ' (' + str(count) + ' tokens)')
+
+    def _fetchMetadata(self, baseURL, tokenId):
+        """
+        Fetching the metadata of the token, reading it from the cache folder if it has been cached.
+
+        Attributes
+        ----------
+        baseURL : str
+            URL of the collection's metadata without the token id.
+        tokenId : int
+            Id of the token.
+
+        Returns
+        ----------
+        content : bytes
+            Metadata of the token.
+        fetched : bool
+            True if the metadata has been fetched, False if it has been read from the cache.
+        """
+
+        cacheFolder = self.cacheFolder
+        if cacheFolder is not None:
+            try:
+                return (cacheFolder / (str(tokenId) + '.json')).read_bytes(), False
+            except OSError:
                 pass
-            start += 1
+        return self._requestMetadata(baseURL + str(tokenId)), True
 
-        for i in range(start, end + 1):
+    @retry(wait=wait_exponential(multiplier=0.2, max=10),
+           stop=stop_after_attempt(6),
+           retry=retry_if_exception(_isTransientMetadataError),
+           reraise=True)
+    def _requestMetadata(self, url):
+        """
+        Requesting the metadata of the token. The request is repeated with exponential backoff when the host has
+        throttled it or has failed.
+
+        Attributes
+        ----------
+        url : str
+            URL of the token's metadata.
+
+        Returns
+        ----------
+        content : bytes
+            Metadata of the token.
+        """
+
+        response = self._metadataClient.get(url)
+        response.raise_for_status()
+        return response.content
+
+    def _addAttributes(self, tokenId, future, warningCounts):
+        """
+        Parsing the fetched metadata of the token and appending its attributes to the list of attributes. Problems
+        with the metadata are counted in warningCounts.
+
+        Attributes
+        ----------
+        tokenId : int
+            Id of the token.
+        future : concurrent.futures.Future
+            Future of the token's _fetchMetadata call.
+        warningCounts : collections.Counter
+            Number of tokens per warning message.
+        """
+
+        doc = None
+        try:
+            content, fetched = future.result()
             try:
-                r = requests.get(baseURL + str(i)).json()
-                if not ('attributes' in r):
-                    warnings.warn("The parsed json does not contain attributes.")
-                else:
-                    r['attributes'].append({'trait_type': 'Name', 'value': r['name']})
-                    self.attributes.append([dict(ChainMap(*[{d['trait_type']: d['value']} for d in r['attributes']]))])
-            except ConnectionAbortedError:
-                warnings.warn(
-                    "The connection has aborted. Most likely the real number of tokens is less than the totalSupply.")
-            except JSONDecodeError:
-                warnings.warn("Json has not been found. Most likely the parser has reached the end.")
-
-    def attributesToDF(self, file=True, folderPath=''):
-        """
-        Transforming list of attributes into pandas Dataframe. By default, csv file is created.
+                doc = self._metadataParser.parse(content)
+            except RuntimeError:
+                # simdjson rejects integers wider than 64 bits, such as seed traits, which json parses exactly.
+                doc = json.loads(content)
+            if not ('attributes' in doc):
+                warningCounts["The parsed json does not contain attributes."] += 1
+            else:
+                traits = doc['attributes']
+                if isinstance(traits, simdjson.Array):
+                    traits = traits.as_list()
+                attributes = {d['trait_type']: d['value'] for d in traits}
+                attributes['Name'] = doc['name']
+                self.attributes.append(attributes)
+                if fetched and self.cacheFolder is not None:
+                    self._cacheMetadata(tokenId, content)
+        except httpx.HTTPStatusError as error:
+            if error.response.status_code == 404:
+                self._countMissingMetadata(tokenId, warningCounts)
+            else:
+                warningCounts["The metadata request has been throttled or has failed with an HTTP error."] += 1
+        except httpx.HTTPError:
+            warningCounts["The metadata of the token has not been fetched."] += 1
+        except ValueError:
+            self._countMissingMetadata(tokenId, warningCounts)
+        finally:
+            # The parser can only be reused once the previous document is released.
+            del doc
+
+    @staticmethod
+    def _countMissingMetadata(tokenId, warningCounts):
+        """
+        Counting the token whose metadata does not exist in warningCounts.
+
+        Attributes
+        ----------
+        tokenId : int
+            Id of the token.
+        warningCounts : collections.Counter
+            Number of tokens per warning message.
+        """
+
+        if tokenId == 0:
+            warningCounts["The NFT collection starts from id #1, not id #0."] += 1
+        else:
+            warningCounts["Json has not been found. Most likely the parser has reached the end."] += 1
+
+    def _cacheMetadata(self, tokenId, content):
+        """
+        Saving the metadata of the token to the cache folder. The file is replaced atomically, so an interrupted write
+        never leaves a truncated document in the cache.
+
+        Attributes
+        ----------
+        tokenId : int
+            Id of the token.
+        content : bytes
+            Fetched metadata of the token.
+        """
+
+        cacheFile = self.cacheFolder / (str(tokenId) + '.json')
+        temporaryFile = cacheFile.with_suffix('.tmp')
+        try:
+            temporaryFile.write_bytes(content)
+            temporaryFile.replace(cacheFile)
+        except OSError as error:
+            self._disableCache(error)
+
+    def _disableCache(self, error):
+        """
+        Disabling the metadata cache of the instance after the cache folder could not be written to. The parsing
+        continues without the cache.
+
+        Attributes
+        ----------
+        error : OSError
+            Error raised by the cache folder.
+        """
+
+        warnings.warn("The metadata cache has been disabled, as the cache folder can not be written to: " + str(error))
+        self.cacheFolder = None
+
+    def attributesToDF(self, file=True, folderPath='', stream=False, fileFormat='csv'):
+        """
+        Transforming list of attributes into pandas Dataframe. By default, csv file is created. The header is written
+        only when the csv file is created, so repeated calls append rows to the same table. The parquet file is
+        overwritten on every call.
 
         Attributes
         ----------
         file : bool
-            If the file is True, then create a csv file of Dataframe.
+            If the file is True, then create a csv or parquet file of Dataframe.
         folderPath : str
-            Path to the folder where csv file will be created.
+            Path to the folder where the file will be created.
+        stream : bool
+            If the stream and the file are True, then write the attributes to the csv file row by row without creating
+            the Dataframe. Not supported for the parquet format.
+        fileFormat : str
+            Format of the created file, 'csv' or 'parquet'.
 
         Returns
         ----------
         attributesDF : pd.DataFrame
-            Dataframe of token's attributes.
+            Dataframe of token's attributes. None if the attributes have been streamed to the csv file.
         """
 
         if not self.attributes:
             raise KeyError("The attributes array is empty.")
-        attributesDF = pd.concat([pd.DataFrame(attribute) for attribute in self.attributes])
+        if fileFormat not in ('csv', 'parquet'):
+            raise ValueError("The file format must be 'csv' or 'parquet'.")
         if file:
             if folderPath[-1] != '/':
                 folderPath += '/'
             attributesFileName = (folderPath
                                   + "attributes_"
-                                  + self.contract.functions.symbol().call()
-                                  + '.csv')
+                                  + self.symbol
+                                  + '.' + fileFormat)
+            if stream:
+                if fileFormat == 'parquet':
+                    raise ValueError("Streaming is supported only for the csv format.")
+                traits = list(dict.fromkeys(trait for attribute in self.attributes for trait in attribute))
+                with open(attributesFileName, "a+", newline='') as file:
+                    writer = csv.writer(file)
+                    if file.tell() == 0:
+                        writer.writerow([''] + traits)
+                    for index, attribute in enumerate(self.attributes):
+                        writer.writerow([index] + [attribute.get(trait, '') for trait in traits])
+                return None
+        attributesDF = pd.DataFrame(self.attributes)
+        if file and fileFormat == 'parquet':
+            self._writeParquet(attributesDF, attributesFileName)
+        elif file:
             with open(attributesFileName, "a+") as file:
-                attributesDF.to_csv(file)
+                attributesDF.to_csv(file, header=file.tell() == 0)
             file.close()
         return (attributesDF)
 
@@ -174,11 +460,16 @@ class Token:
 
         attributesFileName = (folderPath
                               + "attributes_"
-                              + self.contract.functions.symbol().call()
+                              + self.symbol
                               + '.txt')
-        with open(attributesFileName, "a+") as file:
-            file.write(json.dumps(self.attributes))
-        file.close()
+        try:
+            # Trait types are not always strings, while orjson accepts only string keys by default.
+            attributesJSON = orjson.dumps(self.attributes, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson does not serialize integers wider than 64 bits, which traits such as seeds can contain.
+            attributesJSON = json.dumps(self.attributes).encode()
+        with open(attributesFileName, "ab") as file:
+            file.write(attributesJSON)
 
     def parseTransactions(self, transactionsStep=10000, startBlock="00000000", endBlock=-9999):
         """
@@ -205,42 +496,141 @@ class Token:
         transactionsURL = ('https://api.etherscan.io/api?module=account&action=tokennfttx&'
                            + 'contractaddress=' + self.tokenContractAddress
                            + '&page=1&offset=' + str(transactionsStep)
-                           + '&startblock=' + startBlock
-                           + '&endblock=' + endBlock
-                           + '&sort=enc&apikey=' + str(self.etherscanAPIKey))
-        r = requests.get(transactionsURL).json()
-        while r['status'] == '1':
-            for i in range(0, transactionsStep):
-                try:
-                    tempTransHash = r['result'][i]['hash']
-                    tempTransValue = self.web3.eth.getTransaction(tempTransHash)['value']
-                    if (self.web3.eth.getTransaction(tempTransHash)['value']) != 0:
-                        transSale = r['result'][i]
-                        transSale['value'] = tempTransValue
-                        self.transactions.append(transSale)
-                except IndexError:
-                    warnings.warn('Parser has reached the end of transactions.')
-                    return
-            startBlock = r['result'][transactionsStep - 1]['blockNumber']
-            transactionsURL = ('https://api.etherscan.io/api?module=account&action=tokennfttx&'
-                               + 'contractaddress=' + self.tokenContractAddress
-                               + '&page=1&offset=' + str(transactionsStep)
-                               + '&startblock=' + startBlock
-                               + '&endblock=' + endBlock
-                               + '&sort=enc&apikey=' + str(self.etherscanAPIKey))
-            r = requests.get(transactionsURL).json()
-        raise TimeoutError('The transactions have not been parsed successfully.')
-
-    def transactionsToDF(self, file=True, folderPath=''):
-        """
-        Transforming list of attributes into pandas Dataframe. By default, csv file is created.
+                           + '&endblock=' + str(endBlock)
+                           + '&sort=asc&apikey=' + str(self.etherscanAPIKey)
+                           + '&startblock=')
+        missingTransactions = 0
+        while True:
+            r = self._etherscanRequest(transactionsURL + str(startBlock))
+            if r['status'] != '1':
+                # Etherscan answers an empty page with status 0 and an empty result.
+                if r['result'] == []:
+                    break
+                raise TimeoutError('The transactions have not been parsed successfully: ' + str(r['result']))
+            transactionValues = self._getContractTransactionValues(r['result'][0]['blockNumber'],
+                                                                   r['result'][-1]['blockNumber'])
+            transactionValues.update(self._getTransactionValues([transfer['hash'] for transfer in r['result']
+                                                                 if transfer['hash'] not in transactionValues]))
+            for transSale in r['result']:
+                transValue = transactionValues.get(transSale['hash'])
+                if transValue is None:
+                    missingTransactions += 1
+                elif transValue != 0:
+                    transSale['value'] = transValue
+                    self.transactions.append(transSale)
+            if len(r['result']) < transactionsStep:
+                break
+            startBlock = r['result'][-1]['blockNumber']
+        if missingTransactions:
+            warnings.warn("The transaction has not been found by the Web3 provider. ("
+                          + str(missingTransactions) + ' transactions)')
+
+    def _getContractTransactionValues(self, startBlock, endBlock):
+        """
+        Fetching values of the transactions sent to the token's contract from startBlock to endBlock with one
+        etherscan API call. Mints are sent to the contract and are covered, while marketplace sales are not, so the
+        result is incomplete for the transfers of these blocks.
+
+        Attributes
+        ----------
+        startBlock : str
+            Starting block.
+        endBlock : str
+            Ending block.
+
+        Returns
+        ----------
+        transactionValues : dict
+            Values of the transactions in wei, keyed by transaction hash.
+        """
+
+        transactionsURL = ('https://api.etherscan.io/api?module=account&action=txlist'
+                           + '&address=' + self.tokenContractAddress
+                           + '&startblock=' + str(startBlock)
+                           + '&endblock=' + str(endBlock)
+                           + '&page=1&offset=10000&sort=asc&apikey=' + str(self.etherscanAPIKey))
+        r = self._etherscanRequest(transactionsURL)
+        if r['status'] != '1':
+            return {}
+        return {transaction['hash']: int(transaction['value']) for transaction in r['result']}
+
+    def _getTransactionValues(self, transactionHashes, batchSize=500):
+        """
+        Fetching values of transactions from the Web3 provider, sending batchSize eth_getTransactionByHash calls per
+        one JSON-RPC batch request. Every transaction is fetched once, even if its hash is repeated.
+
+        Attributes
+        ----------
+        transactionHashes : list
+            Hashes of the transactions.
+        batchSize : int
+            Number of calls per one batch request.
+
+        Returns
+        ----------
+        transactionValues : dict
+            Values of the transactions in wei, keyed by transaction hash. Transactions for which the provider returns
+            no result are omitted.
+        """
+
+        transactionHashes = list(dict.fromkeys(transactionHashes))
+        transactionValues = {}
+        for batchStart in range(0, len(transactionHashes), batchSize):
+            batch = transactionHashes[batchStart:batchStart + batchSize]
+            payload = [{'jsonrpc': '2.0', 'id': i, 'method': 'eth_getTransactionByHash', 'params': [transactionHash]}
+                       for i, transactionHash in enumerate(batch)]
+            for reply in self._postBatchRequest(payload):
+                if reply['result'] is not None:
+                    transactionValues[batch[reply['id']]] = int(reply['result']['value'], 16)
+        return transactionValues
+
+    @retry(wait=wait_exponential(multiplier=0.2, max=10),
+           stop=stop_after_attempt(6),
+           retry=retry_if_exception_type(_ProviderBatchError) | retry_if_exception(_isTransientRequestError),
+           reraise=True)
+    def _postBatchRequest(self, payload):
+        """
+        Sending JSON-RPC batch request to the Web3 provider. The request is repeated with exponential backoff when the
+        provider has throttled or failed the request or any of its calls, so no call is mistaken for a missing result.
+
+        Attributes
+        ----------
+        payload : list
+            JSON-RPC calls of the batch.
+
+        Returns
+        ----------
+        replies : list
+            Replies to the calls, each containing a result.
+        """
+
+        response = self.session.post(self.providerURL,
+                                     data=orjson.dumps(payload),
+                                     headers={'Content-Type': 'application/json'},
+                                     timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        replies = orjson.loads(response.content)
+        if not isinstance(replies, list):
+            raise _ProviderBatchError("The Web3 provider has rejected the batch request: " + str(replies.get('error')))
+        for reply in replies:
+            if 'error' in reply:
+                raise _ProviderBatchError("The Web3 provider has failed a call of the batch request: "
+                                          + str(reply['error']))
+        return replies
+
+    def transactionsToDF(self, file=True, folderPath='', fileFormat='csv'):
+        """
+        Transforming list of attributes into pandas Dataframe. By default, csv file is created. The parquet file is
+        overwritten on every call.
 
         Attributes
         ----------
         file : bool
-            If the file is True, then create a csv file of Dataframe.
+            If the file is True, then create a csv or parquet file of Dataframe.
         folderPath : str
-            Path to the folder where csv file will be created.
+            Path to the folder where the file will be created.
+        fileFormat : str
+            Format of the created file, 'csv' or 'parquet'.
 
         Returns
         ----------
@@ -250,19 +640,44 @@ class Token:
 
         if not (self.transactions):
             raise KeyError("The transactions array is empty.")
+        if fileFormat not in ('csv', 'parquet'):
+            raise ValueError("The file format must be 'csv' or 'parquet'.")
         transactionsDF = pd.DataFrame(self.transactions)
         if (file):
             if folderPath[-1] != '/':
                 folderPath += '/'
             transactionsFileName = (folderPath
                                     + "transactions_"
-                                    + self.contract.functions.symbol().call()
-                                    + '.csv')
-            with open(transactionsFileName, "a+") as file:
-                transactionsDF.to_csv(file)
-            file.close()
+                                    + self.symbol
+                                    + '.' + fileFormat)
+            if fileFormat == 'parquet':
+                self._writeParquet(transactionsDF, transactionsFileName)
+            else:
+                with open(transactionsFileName, "a+") as file:
+                    transactionsDF.to_csv(file, header=file.tell() == 0)
+                file.close()
         return (transactionsDF)
 
+    @staticmethod
+    def _writeParquet(dataFrame, fileName):
+        """
+        Writing Dataframe into parquet file. Object columns, such as traits mixing numbers and strings or values in wei
+        above the int64 range, can not be stored by parquet and are written as strings, keeping the missing values.
+        Column names are written as strings as well.
+
+        Attributes
+        ----------
+        dataFrame : pd.DataFrame
+            Dataframe to write.
+        fileName : str
+            Path to the parquet file.
+        """
+
+        dataFrame = dataFrame.rename(columns=str)
+        for column in dataFrame.columns[dataFrame.dtypes == object]:
+            dataFrame[column] = dataFrame[column].map(str, na_action='ignore')
+        dataFrame.to_parquet(fileName, engine='pyarrow', compression='zstd')
+
     def transactionsToTextFile(self, path=''):
         """
          Transforming list of transactions into text file.
@@ -276,8 +691,12 @@ class Token:
             raise KeyError("The transactions array is empty.")
         transactionsFileName = (path
                                 + "transactions_"
-                                + self.contract.functions.symbol().call()
+                                + self.symbol
                                 + '.txt')
-        with open(transactionsFileName, "a+") as file:
-            file.write(json.dumps(self.transactions))
-        file.close()
+        try:
+            transactionsJSON = orjson.dumps(self.transactions)
+        except TypeError:
+            # orjson does not serialize integers wider than 64 bits, which large sale values in wei can exceed.
+            transactionsJSON = json.dumps(self.transactions).encode()
+        with open(transactionsFileName, "ab") as file:
+            file.write(transactionsJSON)